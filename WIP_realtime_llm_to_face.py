@@ -15,7 +15,7 @@ warnings.filterwarnings(
 import time
 
 from livelink.connect.livelink_init import create_socket_connection, initialize_py_face
-from livelink.animations.default_animation import default_animation_loop, stop_default_animation
+from livelink.animations.default_animation import default_animation_loop, shutdown_default_animation
 
 from utils.audio_face_workers import audio_face_queue_worker_realtime, conversion_worker
 from utils.audio.record_audio import record_audio_until_release
@@ -94,7 +94,7 @@ def main():
         conversion_worker_thread.join()
         audio_face_queue.put(None)
         audio_worker_thread.join()
-        stop_default_animation.set()
+        shutdown_default_animation()
         default_animation_thread.join()
         pygame.quit()
         socket_connection.close()
@@ -3,59 +3,47 @@
 # Businesses or organizations with **annual revenue of $1,000,000 or more** must obtain permission to use this software commercially.
 
 import os
+import asyncio
 import pygame
 import warnings
 from fastapi import FastAPI, UploadFile, File
-from fastapi.responses import JSONResponse
-from threading import Thread
+from fastapi.responses import ORJSONResponse
+from concurrent.futures import ThreadPoolExecutor
 
 warnings.filterwarnings(
     "ignore", 
     message="Couldn't find ffmpeg or avconv - defaulting to ffmpeg, but may not work"
 )
 
-from livelink.connect.livelink_init import create_socket_connection, initialize_py_face
-from livelink.animations.default_animation import default_animation_loop, stop_default_animation
-from utils.files.file_utils import initialize_directories, ensure_wav_input_folder_exists
+from utils.runtime_singleton import get_runtime, shutdown_runtime
+from utils.files.file_utils import initialize_directories
 from utils.neurosync.neurosync_api_connect import send_audio_to_neurosync
 from utils.generated_runners import prepare_facial_data_for_animation, run_prepared_animation
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
-# Global variables for animation system
-py_face = None
-socket_connection = None
-default_animation_thread = None
+_WAV_INPUT_DIR = os.path.join(os.getcwd(), 'wav_input')
 
-def initialize_animation_system():
-    global py_face, socket_connection, default_animation_thread
-    if py_face is None:
-        py_face = initialize_py_face()
-        socket_connection = create_socket_connection()
-        default_animation_thread = Thread(target=default_animation_loop, args=(py_face,))
-        default_animation_thread.start()
+# Blocking NeuroSync API calls and facial data preparation run here so they do not stall the event loop
+NEUROSYNC_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="neurosync")
 
 @app.on_event("startup")
 async def startup_event():
     initialize_directories()
-    ensure_wav_input_folder_exists(os.path.join(os.getcwd(), 'wav_input'))
-    initialize_animation_system()
+    os.makedirs(_WAV_INPUT_DIR, exist_ok=True)
+    get_runtime()
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    global default_animation_thread
-    if default_animation_thread:
-        stop_default_animation.set()
-        default_animation_thread.join()
+    NEUROSYNC_EXECUTOR.shutdown(wait=True)
+    shutdown_runtime()
     pygame.quit()
-    if socket_connection:
-        socket_connection.close()
 
 @app.post("/process-audio")
 async def process_audio(audio_file: UploadFile = File(...)):
     try:
         if not audio_file:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"error": "Audio file is required"}
             )
@@ -64,52 +52,55 @@ async def process_audio(audio_file: UploadFile = File(...)):
         audio_bytes = await audio_file.read()
 
         if not audio_bytes:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"error": "Empty audio file received"}
             )
 
         # Process the audio with Neurosync API
-        facial_data = send_audio_to_neurosync(audio_bytes)
+        facial_data = await asyncio.get_running_loop().run_in_executor(
+            NEUROSYNC_EXECUTOR, send_audio_to_neurosync, audio_bytes
+        )
         
         if facial_data is None:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"error": "Failed to generate facial data"}
             )
         
         # Prepare facial data for animation
-        encoded_facial_data = prepare_facial_data_for_animation(facial_data)
+        encoded_facial_data = await asyncio.get_running_loop().run_in_executor(
+            NEUROSYNC_EXECUTOR, prepare_facial_data_for_animation, facial_data
+        )
         if encoded_facial_data is None:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"error": "Failed to prepare facial data for animation"}
             )
             
-        # Run the animation in a background thread
-        animation_thread = Thread(
-            target=run_prepared_animation,
-            args=(
-                audio_bytes,
-                encoded_facial_data,
-                py_face,
-                socket_connection,
-                default_animation_thread
-            )
+        # Queue the animation on the animation worker without waiting for it to play
+        runtime = get_runtime()
+        run_prepared_animation(
+            audio_bytes,
+            encoded_facial_data,
+            runtime.py_face,
+            runtime.socket_connection,
+            runtime.default_animation_thread,
+            wait=False
         )
-        animation_thread.start()
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={"message": "Animation started successfully"},
             status_code=200
         )
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": str(e)}
         )
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=6502)
+    # uvicorn's default loop/http settings use uvloop and httptools when installed (see environment.yml)
+    uvicorn.run(app, host="0.0.0.0", port=6502, access_log=False)
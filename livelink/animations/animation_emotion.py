@@ -3,6 +3,7 @@ import numpy as np
 import random
 import os
 import pandas as pd
+from functools import lru_cache
 
 # -------------------- Emotion Detection --------------------
 def determine_highest_emotion(facial_data, perform_calculation=True):
@@ -40,31 +41,46 @@ def adjust_animation_data_length(facial_data, animation_data):
     
     Parameters:
       facial_data: list-like of frames.
-      animation_data: list-like of frames.
+      animation_data (np.ndarray): 2D array of animation frames.
     
     Returns:
-      list: Adjusted animation_data with the same length as facial_data.
+      np.ndarray: Adjusted animation_data with the same length as facial_data.
     """
+    animation_data = np.asarray(animation_data)
     facial_length = len(facial_data)
     animation_length = len(animation_data)
     if animation_length >= facial_length:
         return animation_data[:facial_length]
     else:
-        extended = list(animation_data)
-        for i in range(facial_length - animation_length):
-            extended.append(animation_data[i % animation_length])
-        return extended
+        return animation_data[np.arange(facial_length) % animation_length]
+
+@lru_cache(maxsize=8)
+def get_loop_blend_weights(blend_frame_count):
+    """
+    Returns the cached (blend_frame_count, 1) column of loop-blend weights i / blend_frame_count.
+    """
+    weights = np.arange(blend_frame_count, dtype=np.float32) / blend_frame_count
+    weights.setflags(write=False)
+    return weights[:, np.newaxis]
 
 def blend_data_dimensions_to_loop(facial_data, dimensions, blend_frame_count):
     """
     Smooths the transition between the last and first blend_frame_count frames for the given dimensions.
     
     Parameters:
-      facial_data (list of lists): Facial data frames.
+      facial_data (np.ndarray): Facial data frames.
       dimensions (list of int): Dimensions to smooth.
       blend_frame_count (int): Number of frames over which to blend.
     """
     num_frames = len(facial_data)
+    if num_frames >= 2 * blend_frame_count:
+        # Head and tail windows do not overlap, so the whole blend can be done in one pass.
+        weights = get_loop_blend_weights(blend_frame_count)
+        start_values = facial_data[:blend_frame_count, dimensions]
+        end_values = facial_data[num_frames - blend_frame_count:, dimensions]
+        facial_data[num_frames - blend_frame_count:, dimensions] = (1 - weights) * end_values + weights * start_values
+        return
+
     for dim in dimensions:
         for i in range(blend_frame_count):
             alpha = i / blend_frame_count
@@ -79,24 +95,32 @@ def merge_animation_data_into_facial_data(facial_data, animation_data, dimension
     The neutral pose is assumed to be zero.
     
     Parameters:
-      facial_data (list of lists): Generated facial data.
-      animation_data (list of lists): Emotion animation data (should be adjusted to same length as facial_data).
+      facial_data (np.ndarray): Generated facial data, modified in place.
+      animation_data (np.ndarray): Emotion animation data (should be adjusted to same length as facial_data).
       dimensions (list of int): Indices corresponding to emotion dimensions.
       alpha (float): Blending weight.
     
     Returns:
-      list of lists: Modified facial_data with blended emotion animation.
+      np.ndarray: Modified facial_data with blended emotion animation.
     """
     animation_data = adjust_animation_data_length(facial_data, animation_data)
-    num_frames = len(facial_data)
-    for i in range(num_frames):
-        for dim in dimensions:
-            delta = animation_data[i][dim]
-            facial_data[i][dim] = min(max(facial_data[i][dim] + alpha * delta, 0.0), 1.0)
+    facial_data[:, dimensions] = np.clip(
+        facial_data[:, dimensions] + alpha * animation_data[:, dimensions], 0.0, 1.0
+    )
     return facial_data
 
 
 # -------------------- Emotion Merging --------------------
+# Default emotion dimensions (only include selected emotion-related blendshapes)
+EMOTION_DIMENSIONS = [
+    FaceBlendShape.MouthSmileLeft.value,
+    FaceBlendShape.MouthSmileRight.value,
+    FaceBlendShape.MouthFrownLeft.value,
+    FaceBlendShape.MouthFrownRight.value,
+    FaceBlendShape.NoseSneerLeft.value,
+    FaceBlendShape.NoseSneerRight.value,
+]
+
 def merge_emotion_data_into_facial_data_wrapper(facial_data, emotion_animation_data, dimensions=None, alpha=0.7, blend_frame_count=32):
     """
     Merges preloaded emotion animation data into generated facial data.
@@ -105,25 +129,17 @@ def merge_emotion_data_into_facial_data_wrapper(facial_data, emotion_animation_d
     and first frames to create a seamless loop.
     
     Parameters:
-      facial_data (list of lists): Generated facial data.
-      emotion_animation_data (list of lists): Emotion animation data.
+      facial_data (np.ndarray): Generated facial data, modified in place.
+      emotion_animation_data (np.ndarray): Emotion animation data.
       dimensions (list of int, optional): Indices for emotion dimensions. Defaults to selected emotion blendshapes.
       alpha (float): Blending weight.
       blend_frame_count (int): Number of frames over which to smooth the transition.
     
     Returns:
-      list of lists: Blended facial data.
+      np.ndarray: Blended facial data.
     """
-    # Default emotion dimensions (only include selected emotion-related blendshapes)
     if dimensions is None:
-        dimensions = [
-            FaceBlendShape.MouthSmileLeft.value,
-            FaceBlendShape.MouthSmileRight.value,
-            FaceBlendShape.MouthFrownLeft.value,
-            FaceBlendShape.MouthFrownRight.value,
-            FaceBlendShape.NoseSneerLeft.value,
-            FaceBlendShape.NoseSneerRight.value,
-        ]
+        dimensions = EMOTION_DIMENSIONS
     
     # Ensure emotion_animation_data matches the length of facial_data.
     emotion_animation_data = adjust_animation_data_length(facial_data, emotion_animation_data)
@@ -170,7 +186,7 @@ def blend_animation(data, blend_frames=30):
 def load_emotion_animations(folder_path, blend_frames=30):
     """
     Loads all CSV files from a given emotion folder, blends their start and end frames,
-    and returns a list of blended animations.
+    and returns a list of blended animations as contiguous float32 arrays, ready to merge.
     """
     animations = []
     if not os.path.isdir(folder_path):
@@ -183,7 +199,7 @@ def load_emotion_animations(folder_path, blend_frames=30):
             if animation is not None:
                 try:
                     blended = blend_animation(animation, blend_frames=blend_frames)
-                    animations.append(blended)
+                    animations.append(np.ascontiguousarray(blended, dtype=np.float32))
                 except Exception as e:
                     print(f"Error blending animation {file_path}: {e}")
     return animations
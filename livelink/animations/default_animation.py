@@ -6,6 +6,7 @@ import time
 import socket
 import numpy as np
 import pandas as pd
+from queue import Queue, Empty
 from threading import Event
 
 from livelink.connect.livelink_init import FaceBlendShape, UDP_IP, UDP_PORT
@@ -39,16 +40,47 @@ def blend_animation(data, blend_frames=30):
 
 blended_animation_data = blend_animation(default_animation_data, blend_frames=30)
 
-stop_default_animation = Event()
+# Commands for the long-lived default animation worker: (command, ack_event or None)
+default_animation_commands = Queue()
+DEFAULT_ANIMATION_FRAME_DURATION = 1 / 60
+COMMAND_ACK_TIMEOUT = 1.0
+
+def _post_command(command, wait=False):
+    """Queue a command for the worker. Returns False if the worker did not acknowledge it in time."""
+    ack = Event() if wait else None
+    default_animation_commands.put((command, ack))
+    if ack is not None and not ack.wait(timeout=COMMAND_ACK_TIMEOUT):
+        # Mark the command as expired, so a worker started later does not act on it
+        ack.set()
+        print(f"Default animation worker did not acknowledge '{command}' within {COMMAND_ACK_TIMEOUT}s")
+        return False
+    return True
+
+def pause_default_animation(wait=True):
+    """Stop the default animation sending frames. By default waits until the worker has paused."""
+    return _post_command("pause", wait)
+
+def resume_default_animation():
+    """Restart the default animation from its first frame."""
+    return _post_command("resume")
+
+def shutdown_default_animation():
+    """Make the default animation worker exit; join its thread afterwards."""
+    return _post_command("shutdown")
 
 def default_animation_loop(py_face):
+    paused = False
+    frame_index = 0
+    next_frame_time = time.perf_counter()
     with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
         s.connect((UDP_IP, UDP_PORT))
-        while not stop_default_animation.is_set():
-            for frame in blended_animation_data:
-                # Check before processing each frame
-                if stop_default_animation.is_set():
-                    break
+        while True:
+            # Wait for the next frame slot, waking early if a command arrives
+            timeout = None if paused else max(0.0, next_frame_time - time.perf_counter())
+            try:
+                command, ack = default_animation_commands.get(timeout=timeout)
+            except Empty:
+                frame = blended_animation_data[frame_index]
 
                 # Apply the frame blendshapes
                 for i, value in enumerate(frame):
@@ -59,10 +91,24 @@ def default_animation_loop(py_face):
                     s.sendall(py_face.encode())
                 except Exception as e:
                     print(f"Error in default animation sending: {e}")
-                
-                # Instead of one long sleep, break it into short chunks
-                total_sleep = 1 / 60
-                sleep_interval = 0.005  # check every 5ms
-                while total_sleep > 0 and not stop_default_animation.is_set():
-                    time.sleep(min(sleep_interval, total_sleep))
-                    total_sleep -= sleep_interval
+
+                frame_index = (frame_index + 1) % len(blended_animation_data)
+                next_frame_time = max(next_frame_time + DEFAULT_ANIMATION_FRAME_DURATION, time.perf_counter())
+                continue
+
+            if ack is not None and ack.is_set():
+                continue  # The caller gave up waiting for this command
+
+            if command == "shutdown":
+                if ack is not None:
+                    ack.set()
+                break
+            elif command == "pause":
+                paused = True
+            elif command == "resume" and paused:
+                paused = False
+                frame_index = 0
+                next_frame_time = time.perf_counter()
+
+            if ack is not None:
+                ack.set()
@@ -68,6 +68,11 @@ def scale_blendshapes_by_section(blendshapes: List[float], mouth_scale: float, e
         return scaled_blendshapes
 
 
+# Timecode frames, sub frame, fps and denominator followed by the blendshape payload, as packed by encode()
+FRAME_TIME_STRUCT = struct.Struct("!IIII")
+BLENDSHAPE_STRUCT = struct.Struct('!B61f')
+
+
 class PyLiveLinkFace:
     def __init__(self, name: str = "face1", uuid: str = str(uuid.uuid1()), fps=60, filter_size: int = 0) -> None:
         self.uuid = f"${uuid}" if not uuid.startswith("$") else uuid
@@ -87,6 +92,7 @@ class PyLiveLinkFace:
         self._denominator = int(self.fps / 60)
         self._blend_shapes = [0.0] * 61
         self._old_blend_shapes = [deque([0.0], maxlen=filter_size) for _ in range(61)]
+        self._prefix_cache = None
 
     def encode(self) -> bytes:
         version_packed = struct.pack('<I', self._version)
@@ -104,6 +110,35 @@ class PyLiveLinkFace:
         data_packed = struct.pack('!B61f', 61, *scaled_blend_shapes)
         return version_packed + uuid_packed + name_length_packed + name_packed + frames_packed + frame_rate_packed + data_packed
 
+    def _encode_prefix(self) -> bytes:
+        # Version, uuid and name only change if the attributes are reassigned, so cache the packed bytes
+        key = (self._version, self.uuid, self.name)
+        cached = self._prefix_cache
+        if cached is None or cached[0] != key:
+            prefix = struct.pack('<I', self._version) + self.uuid.encode('utf-8') + struct.pack('!i', len(self.name)) + self.name.encode('utf-8')
+            cached = self._prefix_cache = (key, prefix)
+        return cached[1]
+
+    def encoded_size(self) -> int:
+        """Size in bytes of one frame as produced by encode()."""
+        return len(self._encode_prefix()) + FRAME_TIME_STRUCT.size + BLENDSHAPE_STRUCT.size
+
+    def encode_into(self, buffer, offset: int = 0) -> int:
+        """Writes the same packet as encode() into buffer at offset, without allocating it. Returns bytes written."""
+        prefix = self._encode_prefix()
+        position = offset + len(prefix)
+        buffer[offset:position] = prefix
+        now = datetime.datetime.now()
+        timcode = Timecode(self.fps, f'{now.hour}:{now.minute}:{now.second}:{now.microsecond * 0.001}')
+        FRAME_TIME_STRUCT.pack_into(buffer, position, timcode.frames, self._sub_frame, self.fps, self._denominator)
+        position += FRAME_TIME_STRUCT.size
+
+        # Apply different scaling factors for sections
+        scaled_blend_shapes = scale_blendshapes_by_section(self._blend_shapes, self._scaling_factor_mouth, self._scaling_factor_eyes, self._scaling_factor_eyebrows)
+
+        BLENDSHAPE_STRUCT.pack_into(buffer, position, 61, *scaled_blend_shapes)
+        return position + BLENDSHAPE_STRUCT.size - offset
+
     def set_blendshape(self, index: FaceBlendShape, value: float, no_filter: bool = True) -> None:        
         if index in [FaceBlendShape.HeadYaw, FaceBlendShape.HeadPitch, FaceBlendShape.HeadRoll]:
             value = max(min(value, 0.00), -0.00) 
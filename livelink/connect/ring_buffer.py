@@ -0,0 +1,47 @@
+# This software is licensed under a **dual-license model**
+# For individuals and businesses earning **under $1M per year**, this software is licensed under the **MIT License**
+# Businesses or organizations with **annual revenue of $1,000,000 or more** must obtain permission to use this software commercially.
+
+# ring_buffer.py
+
+from typing import Any, List, Optional
+
+
+class SPSCRingBuffer:
+    """
+    Fixed-size single-producer / single-consumer ring buffer.
+
+    Only the producer thread calls push() and only the consumer thread calls pop().
+    The producer is the only writer of _tail and the consumer the only writer of _head,
+    and each index update is a single atomic store under the GIL, so no lock is needed.
+    One slot is always left empty to tell a full buffer from an empty one.
+    """
+
+    def __init__(self, capacity: int = 128) -> None:
+        self._size = capacity + 1
+        self._slots: List[Any] = [None] * self._size
+        self._head = 0
+        self._tail = 0
+
+    def push(self, item: Any) -> bool:
+        """Append an item. Returns False (and drops the item) if the buffer is full."""
+        tail = self._tail
+        next_tail = (tail + 1) % self._size
+        if next_tail == self._head:
+            return False
+        self._slots[tail] = item
+        self._tail = next_tail
+        return True
+
+    def pop(self) -> Optional[Any]:
+        """Remove and return the oldest item, or None if the buffer is empty."""
+        head = self._head
+        if head == self._tail:
+            return None
+        item = self._slots[head]
+        self._slots[head] = None
+        self._head = (head + 1) % self._size
+        return item
+
+    def __len__(self) -> int:
+        return (self._tail - self._head) % self._size
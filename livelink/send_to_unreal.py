@@ -5,9 +5,11 @@
 
 import time
 import numpy as np
-from typing import List
+from threading import Thread, Event
+from typing import List, Sequence
 
 from livelink.connect.livelink_init import create_socket_connection, FaceBlendShape
+from livelink.connect.ring_buffer import SPSCRingBuffer
 from livelink.animations.default_animation import default_animation_data
 from livelink.animations.blending_anims import blend_in, blend_out  
 
@@ -132,16 +134,65 @@ def pre_encode_facial_data_blend_out(facial_data: List[np.ndarray], py_face, fps
     return encoded_data
 
 
-def pre_encode_facial_data(facial_data: List[np.ndarray], py_face, fps: int = 60) -> List[bytes]:
+class EncodedFrameBuffer:
     """
-    Pre-encodes facial animation data while ensuring blinks, squints, and eye-wide blendshapes
-    use the default animation data.
+    Pre-encoded frames stored back to back in one preallocated bytearray.
+    Behaves like a read-only list of frames: iterating or indexing yields memoryview
+    slices into the shared buffer, so no per-frame bytes objects are kept.
     """
-    encoded_data = []
 
+    def __init__(self, frame_count: int, frame_size: int) -> None:
+        self.frame_size = frame_size
+        self._buffer = bytearray(frame_count * frame_size)
+        self._view = memoryview(self._buffer)
+        self._capacity = frame_count
+        self._count = 0
+
+    def encode_frame(self, py_face) -> None:
+        """Encode the current state of py_face straight into the next frame slot."""
+        if self._count >= self._capacity:
+            raise IndexError("EncodedFrameBuffer is full")
+        py_face.encode_into(self._buffer, self._count * self.frame_size)
+        self._count += 1
+
+    def append(self, frame_data: bytes) -> None:
+        """Copy an already encoded frame into the next slot (list-compatible, used by blend_in/blend_out)."""
+        if self._count >= self._capacity:
+            raise IndexError("EncodedFrameBuffer is full")
+        start = self._count * self.frame_size
+        self._view[start:start + self.frame_size] = frame_data
+        self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> memoryview:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("frame index out of range")
+        start = index * self.frame_size
+        return self._view[start:start + self.frame_size]
+
+    def __iter__(self):
+        frame_size = self.frame_size
+        view = self._view
+        for start in range(0, self._count * frame_size, frame_size):
+            yield view[start:start + frame_size]
+
+
+def pre_encode_facial_data(facial_data: np.ndarray, py_face, fps: int = 60) -> EncodedFrameBuffer:
+    """
+    Pre-encodes facial animation data while ensuring blinks, squints, and eye-wide blendshapes
+    use the default animation data. Accepts a 2D array (or list of frames); rows are read as views.
+    All frames are written into a single preallocated EncodedFrameBuffer.
+    """
     blend_in_frames = int(0.05 * fps)
     blend_out_frames = int(0.3 * fps)
 
+    main_frames = len(range(len(facial_data))[blend_in_frames:-blend_out_frames])
+    encoded_data = EncodedFrameBuffer(blend_in_frames + main_frames + blend_out_frames, py_face.encoded_size())
+
     # Indices of blendshapes to replace with default animation values
     eye_replacement_indices = [
         FaceBlendShape.EyeBlinkLeft.value, FaceBlendShape.EyeBlinkRight.value, 
@@ -170,7 +221,7 @@ def pre_encode_facial_data(facial_data: List[np.ndarray], py_face, fps: int = 60
             else:
                 py_face.set_blendshape(FaceBlendShape(i), frame_data[i])
         
-        encoded_data.append(py_face.encode())
+        encoded_data.encode_frame(py_face)
 
     # Blend out phase
     # --- Added: Capture start time for blend out ---
@@ -185,20 +236,52 @@ def pre_encode_facial_data(facial_data: List[np.ndarray], py_face, fps: int = 60
     return encoded_data
 
 
-def send_pre_encoded_data_to_unreal(encoded_facial_data: List[bytes], start_event, fps: int, socket_connection=None):
+SEND_BUFFER_FRAMES = 128
+
+
+def socket_writer_loop(frame_buffer: SPSCRingBuffer, socket_connection, frame_ready: Event, finished: Event):
+    """
+    Consumer side of the send path: drains every frame queued in the ring buffer onto the
+    socket, then sleeps until the producer signals more frames (or that it has finished).
+    """
+    while True:
+        done = finished.is_set()
+        frame_data = frame_buffer.pop()
+        if frame_data is None:
+            if done:
+                break
+            frame_ready.wait()
+            frame_ready.clear()  # Cleared before the next pop, so a push made meanwhile is not missed
+            continue
+        try:
+            socket_connection.sendall(frame_data)  # Send the frame
+        except Exception as e:
+            print(f"Error sending frame to Unreal: {e}")
+
+
+def send_pre_encoded_data_to_unreal(encoded_facial_data: Sequence[bytes], start_event, fps: int, socket_connection=None):
+    own_socket = False
+    frame_ready = Event()
+    finished = Event()
+    writer_thread = None
     try:
-        own_socket = False
         if socket_connection is None:
             socket_connection = create_socket_connection()
             own_socket = True
 
+        # Frames are paced here and handed to a dedicated writer thread, so a brief
+        # socket stall does not hold up the 60 fps schedule.
+        frame_buffer = SPSCRingBuffer(SEND_BUFFER_FRAMES)
+        writer_thread = Thread(target=socket_writer_loop, args=(frame_buffer, socket_connection, frame_ready, finished), daemon=True)
+        writer_thread.start()
+
         start_event.wait()  # Wait until the event signals to start
 
         frame_duration = 1 / fps  # Time per frame in seconds
-        start_time = time.time()  # Get the initial start time
+        start_time = time.perf_counter()  # Get the initial start time
 
         for frame_index, frame_data in enumerate(encoded_facial_data):
-            current_time = time.time()
+            current_time = time.perf_counter()
             elapsed_time = current_time - start_time
 
             expected_time = frame_index * frame_duration 
@@ -207,10 +290,15 @@ def send_pre_encoded_data_to_unreal(encoded_facial_data: List[bytes], start_even
             elif elapsed_time > expected_time + frame_duration:
                 continue
 
-            socket_connection.sendall(frame_data)  # Send the frame
+            frame_buffer.push(frame_data)  # Dropped if the writer is a full buffer behind
+            frame_ready.set()
 
     except KeyboardInterrupt:
         pass
     finally:
+        finished.set()
+        frame_ready.set()
+        if writer_thread:
+            writer_thread.join()
         if own_socket:
             socket_connection.close()
@@ -10,9 +10,9 @@ warnings.filterwarnings(
 )
 
 from threading import Thread
-from livelink.animations.default_animation import default_animation_loop, stop_default_animation
+from livelink.animations.default_animation import default_animation_loop, shutdown_default_animation
 from livelink.connect.livelink_init import create_socket_connection, initialize_py_face
-from utils.files.file_utils import list_generated_files, load_facial_data_from_csv
+from utils.files.file_utils import list_generated_files, load_facial_data
 from utils.generated_runners import run_audio_animation
 
 py_face = initialize_py_face()
@@ -46,7 +46,7 @@ def main():
         if 0 <= index < len(generated_files):
             audio_path, shapes_path = generated_files[index]
             try:
-                generated_facial_data = load_facial_data_from_csv(shapes_path)
+                generated_facial_data = load_facial_data(shapes_path)
             except Exception as e:
                 print("Error loading facial data:", e)
                 continue
@@ -61,7 +61,7 @@ if __name__ == '__main__':
     try:
         main()
     finally:
-        stop_default_animation.set()
+        shutdown_default_animation()
         if default_animation_thread:
             default_animation_thread.join()
         pygame.quit()
@@ -9,7 +9,7 @@ import keyboard
 from threading import Thread
 
 from livelink.connect.livelink_init import create_socket_connection, initialize_py_face
-from livelink.animations.default_animation import default_animation_loop, stop_default_animation
+from livelink.animations.default_animation import default_animation_loop, shutdown_default_animation
 
 from utils.tts.eleven_labs import get_speech_to_speech_audio
 from utils.audio.record_audio import record_audio_until_release
@@ -69,7 +69,7 @@ if __name__ == "__main__":
 
     finally:
         # Stop the default animation when quitting
-        stop_default_animation.set()
+        shutdown_default_animation()
         if default_animation_thread:
             default_animation_thread.join()
         pygame.quit()
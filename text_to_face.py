@@ -11,7 +11,7 @@ warnings.filterwarnings(
     message="Couldn't find ffmpeg or avconv - defaulting to ffmpeg, but may not work"
 )
 from livelink.connect.livelink_init import create_socket_connection, initialize_py_face
-from livelink.animations.default_animation import default_animation_loop, stop_default_animation
+from livelink.animations.default_animation import default_animation_loop, shutdown_default_animation
 
 from utils.files.file_utils import save_generated_data, initialize_directories
 from utils.generated_runners import run_audio_animation_from_bytes
@@ -71,7 +71,7 @@ if __name__ == "__main__":
 
     finally:
         # Stop the default animation when quitting
-        stop_default_animation.set()
+        shutdown_default_animation()
         if default_animation_thread:
             default_animation_thread.join()
         pygame.quit()
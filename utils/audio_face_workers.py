@@ -5,19 +5,17 @@
 
 import os
 import time
-from threading import Thread, Event, Lock
+from threading import Thread, Event
 from queue import Queue
 
 from utils.generated_runners import run_audio_animation_from_bytes, run_audio_animation
-from livelink.animations.default_animation import default_animation_loop, stop_default_animation
+from livelink.animations.default_animation import resume_default_animation
 from utils.llm.realtime_queue_utils import playback_loop, accumulate_data
 from utils.files.file_utils import save_generated_data_from_wav
 from utils.neurosync.neurosync_api_connect import send_audio_to_neurosync
 from utils.audio.play_audio import read_audio_file_as_bytes
 from utils.audio.convert_audio import bytes_to_wav
 
-queue_lock = Lock()
-
 def audio_face_queue_worker_realtime(audio_face_queue, py_face, socket_connection, default_animation_thread):
     """
     Streams (audio_bytes, facial_data) pairs in real-time.
@@ -79,10 +77,7 @@ def audio_face_queue_worker_realtime(audio_face_queue, py_face, socket_connectio
     log_thread.join()
 
     time.sleep(0.01)
-    with queue_lock:
-        stop_default_animation.clear()
-        new_default_thread = Thread(target=default_animation_loop, args=(py_face,))
-        new_default_thread.start()
+    resume_default_animation()
 
 def audio_face_queue_worker(audio_face_queue, py_face, socket_connection, default_animation_thread):
     """
@@ -48,8 +48,9 @@ def reprocess_generated_files():
                 unique_old_name = f"shapes_{uuid.uuid4()}.csv"
                 shutil.move(shapes_path, os.path.join(old_dir, unique_old_name))
             
-            # Save the new blendshapes as a CSV
+            # Save the new blendshapes as a CSV and refresh the binary copy
             save_generated_data_as_csv(generated_facial_data, shapes_path)
+            save_facial_data_npy(generated_facial_data, shapes_path)
             
             print(f"New shapes.csv generated and old shapes.csv moved to {old_dir}")
 
@@ -96,6 +97,24 @@ def load_facial_data_from_csv(csv_path):
     return data.values
 
 
+def get_npy_path(shapes_path):
+    """Path of the binary copy of the facial data stored next to shapes.csv."""
+    return os.path.splitext(shapes_path)[0] + '.npy'
+
+
+def save_facial_data_npy(generated_facial_data, shapes_path):
+    """Save the facial data as .npy next to shapes.csv so playback can skip CSV parsing."""
+    np.save(get_npy_path(shapes_path), np.asarray(generated_facial_data, dtype=np.float32))
+
+
+def load_facial_data(shapes_path):
+    """Load facial data, preferring the binary .npy copy and falling back to the CSV."""
+    npy_path = get_npy_path(shapes_path)
+    if os.path.exists(npy_path):
+        return np.load(npy_path)
+    return load_facial_data_from_csv(shapes_path)
+
+
 def save_generated_data(audio_bytes, generated_facial_data):
     unique_id = str(uuid.uuid4())
     output_dir = os.path.join(GENERATED_DIR, unique_id)
@@ -117,8 +136,9 @@ def save_generated_data(audio_bytes, generated_facial_data):
         with sf.SoundFile(audio_path, mode='w', samplerate=88200, channels=1, format='WAV', subtype='PCM_16') as f:
             f.write(np.frombuffer(audio_bytes, dtype=np.int16))
 
-    # Save the generated facial data as a CSV file
+    # Save the generated facial data as a CSV file, plus a binary copy for fast playback
     save_generated_data_as_csv(generated_facial_data, shapes_path)
+    save_facial_data_npy(generated_facial_data, shapes_path)
 
     return unique_id, audio_path, shapes_path
 
@@ -138,5 +158,6 @@ def save_generated_data_from_wav(wav_file_path, generated_facial_data):
         print(f"Audio file '{wav_file_path}' is already in the correct location.")
 
     save_generated_data_as_csv(generated_facial_data, shapes_path)
+    save_facial_data_npy(generated_facial_data, shapes_path)
 
     return unique_id, audio_path, shapes_path
@@ -2,7 +2,10 @@
 # For individuals and businesses earning **under $1M per year**, this software is licensed under the **MIT License**
 # Businesses or organizations with **annual revenue of $1,000,000 or more** must obtain permission to use this software commercially.
 
+import logging
 from threading import Thread, Event, Lock
+from queue import Queue
+from concurrent.futures import Future
 import numpy as np
 import random
 from utils.audio.play_audio import (
@@ -12,8 +15,9 @@ from utils.audio.play_audio import (
     play_audio_from_memory_openai
 )
 from livelink.send_to_unreal import pre_encode_facial_data, send_pre_encoded_data_to_unreal
-from livelink.animations.default_animation import default_animation_loop, stop_default_animation
+from livelink.animations.default_animation import pause_default_animation, resume_default_animation
 from livelink.connect.livelink_init import initialize_py_face 
+from livelink.connect.faceblendshapes import FaceBlendShape
 
 # Import emotion functions and preloaded global emotion_animations.
 from livelink.animations.animation_emotion import (
@@ -22,7 +26,100 @@ from livelink.animations.animation_emotion import (
     emotion_animations
 )
 
-queue_lock = Lock()
+logger = logging.getLogger(__name__)
+
+# Frames blended when looping the emotion animation into the facial data
+EMOTION_BLEND_FRAMES = 32
+# Clips shorter than the blend window (about half a second at 60 fps) skip emotion detection and merging
+MIN_EMOTION_FRAMES = EMOTION_BLEND_FRAMES
+
+# Animations share one socket_connection and the default animation, so they are played
+# one at a time by a single worker that owns pause/resume of the default animation.
+_ANIM_QUEUE = Queue()
+_animation_worker_thread = None
+_animation_worker_start_lock = Lock()
+
+def _play_animation(play_audio, audio_source, encoded_facial_data, socket_connection):
+    pause_default_animation()
+    try:
+        start_event = Event()
+
+        audio_thread = Thread(target=play_audio, args=(audio_source, start_event))
+        data_thread = Thread(target=send_pre_encoded_data_to_unreal, args=(encoded_facial_data, start_event, 60, socket_connection))
+
+        audio_thread.start()
+        data_thread.start()
+        start_event.set()
+
+        audio_thread.join()
+        data_thread.join()
+    finally:
+        resume_default_animation()
+
+def _animation_worker():
+    while True:
+        job = _ANIM_QUEUE.get()
+        if job is None:
+            break
+        play_audio, audio_source, encoded_facial_data, socket_connection, fut = job
+        if not fut.set_running_or_notify_cancel():
+            continue
+        try:
+            _play_animation(play_audio, audio_source, encoded_facial_data, socket_connection)
+            fut.set_result(None)
+        except Exception as e:
+            # Callers that queue with wait=False never look at the Future, so report it here too
+            print(f"Error playing animation: {e}")
+            fut.set_exception(e)
+
+def start_animation_worker():
+    """Start the animation worker if it is not already running."""
+    global _animation_worker_thread
+    with _animation_worker_start_lock:
+        if _animation_worker_thread is None or not _animation_worker_thread.is_alive():
+            _animation_worker_thread = Thread(target=_animation_worker, name="animation-worker", daemon=True)
+            _animation_worker_thread.start()
+
+def stop_animation_worker():
+    """Let the worker finish the animations already queued, then stop it."""
+    global _animation_worker_thread
+    with _animation_worker_start_lock:
+        worker, _animation_worker_thread = _animation_worker_thread, None
+    if worker is not None and worker.is_alive():
+        _ANIM_QUEUE.put(None)
+        worker.join()
+
+def enqueue_animation(play_audio, audio_source, encoded_facial_data, socket_connection):
+    """Queue an animation for the worker, starting it on first use. Returns a Future for its completion."""
+    start_animation_worker()
+    fut = Future()
+    _ANIM_QUEUE.put((play_audio, audio_source, encoded_facial_data, socket_connection, fut))
+    return fut
+
+# Pool of spare PyFace instances used only for pre-encoding, so each request
+# does not have to construct and initialise a new one.
+_encoding_face_pool = []
+_encoding_face_pool_lock = Lock()
+
+def acquire_encoding_face():
+    """Take a PyFace instance from the encoding pool, creating one if the pool is empty."""
+    with _encoding_face_pool_lock:
+        if _encoding_face_pool:
+            return _encoding_face_pool.pop()
+    return initialize_py_face()
+
+def release_encoding_face(encoding_face):
+    """Reset the blendshapes of an encoding PyFace and return it to the pool."""
+    for i in range(61):
+        encoding_face.set_blendshape(FaceBlendShape(i), 0.0)
+    with _encoding_face_pool_lock:
+        _encoding_face_pool.append(encoding_face)
+
+def preload_encoding_faces(count=1):
+    """Pre-seed the encoding pool so the first requests do not pay for PyFace construction."""
+    faces = [initialize_py_face() for _ in range(count)]
+    with _encoding_face_pool_lock:
+        _encoding_face_pool.extend(faces)
 
 def run_encoded_audio_animation(audio_bytes, encoded_facial_data, socket_connection):
     start_event = Event()
@@ -52,6 +149,24 @@ def play_audio_and_animation_openai_realtime(playback_audio, playback_facial_dat
     audio_thread.join()
     data_thread.join()
 
+def apply_dominant_emotion(facial_data_array):
+    """Merge a random animation of the dominant emotion into the facial data.
+
+    Clips shorter than MIN_EMOTION_FRAMES are returned unchanged.
+    """
+    if facial_data_array.shape[0] < MIN_EMOTION_FRAMES:
+        return facial_data_array
+
+    dominant_emotion = determine_highest_emotion(facial_data_array)
+    logger.debug("Dominant emotion: %s", dominant_emotion)
+
+    if dominant_emotion in emotion_animations and len(emotion_animations[dominant_emotion]) > 0:
+        selected_animation = random.choice(emotion_animations[dominant_emotion])
+        facial_data_array = merge_emotion_data_into_facial_data_wrapper(
+            facial_data_array, selected_animation, alpha=0.7, blend_frame_count=EMOTION_BLEND_FRAMES
+        )
+    return facial_data_array
+
 def prepare_facial_data_for_animation(generated_facial_data):
     """Prepare facial data by validating, processing emotions, and encoding for animation.
     
@@ -67,26 +182,21 @@ def prepare_facial_data_for_animation(generated_facial_data):
             len(generated_facial_data[0]) > 61):
         return None
     
-    # Convert to mutable list-of-lists if necessary
-    if isinstance(generated_facial_data, np.ndarray):
-        generated_facial_data = generated_facial_data.tolist()
+    # Single mutable float32 copy of the data (blendshape weights are 0..1), used for
+    # emotion detection, merging and encoding
+    facial_data_array = np.array(generated_facial_data, dtype=np.float32)
     
     # Process emotions and merge animation
-    facial_data_array = np.array(generated_facial_data)
-    dominant_emotion = determine_highest_emotion(facial_data_array)
-    print(f"Dominant emotion: {dominant_emotion}")
+    facial_data_array = apply_dominant_emotion(facial_data_array)
     
-    if dominant_emotion in emotion_animations and len(emotion_animations[dominant_emotion]) > 0:
-        selected_animation = random.choice(emotion_animations[dominant_emotion])
-        generated_facial_data = merge_emotion_data_into_facial_data_wrapper(
-            generated_facial_data, selected_animation, alpha=0.7, blend_frame_count=32
-        )
-    
-    # Create a separate instance for encoding
-    encoding_face = initialize_py_face()
-    return pre_encode_facial_data(generated_facial_data, encoding_face)
-
-def run_prepared_animation(audio_bytes, encoded_facial_data, py_face, socket_connection, default_animation_thread):
+    # Borrow a separate instance for encoding
+    encoding_face = acquire_encoding_face()
+    try:
+        return pre_encode_facial_data(facial_data_array, encoding_face)
+    finally:
+        release_encoding_face(encoding_face)
+
+def run_prepared_animation(audio_bytes, encoded_facial_data, py_face, socket_connection, default_animation_thread, wait=True):
     """Run the prepared animation with synchronized audio playback.
     
     Args:
@@ -95,28 +205,15 @@ def run_prepared_animation(audio_bytes, encoded_facial_data, py_face, socket_con
         py_face: PyFace instance for animation
         socket_connection: Socket for sending data
         default_animation_thread: Thread running default animation
-    """
-    with queue_lock:
-        stop_default_animation.set()
-        if default_animation_thread and default_animation_thread.is_alive():
-            default_animation_thread.join()
-
-    start_event = Event()
-
-    audio_thread = Thread(target=play_audio_from_memory, args=(audio_bytes, start_event))
-    data_thread = Thread(target=send_pre_encoded_data_to_unreal, args=(encoded_facial_data, start_event, 60, socket_connection))
+        wait: Block until the animation has finished playing
 
-    audio_thread.start()
-    data_thread.start()
-    start_event.set()
-    
-    audio_thread.join()
-    data_thread.join()
-
-    with queue_lock:
-        stop_default_animation.clear()
-        default_animation_thread = Thread(target=default_animation_loop, args=(py_face,))
-        default_animation_thread.start()
+    Returns:
+        Future that completes when the animation has finished playing
+    """
+    fut = enqueue_animation(play_audio_from_memory, audio_bytes, encoded_facial_data, socket_connection)
+    if wait:
+        fut.result()
+    return fut
 
 def run_audio_animation_from_bytes(audio_bytes, generated_facial_data, py_face, socket_connection, default_animation_thread):
     """Main function that combines data preparation and animation execution.
@@ -140,46 +237,14 @@ def run_audio_animation(audio_path, generated_facial_data, py_face, socket_conne
         len(generated_facial_data) > 0 and 
         len(generated_facial_data[0]) > 61):
         
-        if isinstance(generated_facial_data, np.ndarray):
-            generated_facial_data = generated_facial_data.tolist()
-        
-        facial_data_array = np.array(generated_facial_data)
-        dominant_emotion = determine_highest_emotion(facial_data_array)
-        print(f"Dominant emotion: {dominant_emotion}")
-        if dominant_emotion in emotion_animations and len(emotion_animations[dominant_emotion]) > 0:
-            selected_animation = random.choice(emotion_animations[dominant_emotion])
-            generated_facial_data = merge_emotion_data_into_facial_data_wrapper(
-                generated_facial_data, selected_animation, alpha=0.7, blend_frame_count=32
-            )
-    
-    # Create a temporary encoding instance for blending.
-    encoding_face = initialize_py_face()
-    encoded_facial_data = pre_encode_facial_data(generated_facial_data, encoding_face)
-
-    with queue_lock:
-        stop_default_animation.set()
-        if default_animation_thread and default_animation_thread.is_alive():
-            default_animation_thread.join()
-
-    start_event = Event()
-
-    audio_thread = Thread(target=play_audio_from_path, args=(audio_path, start_event))
-    data_thread = Thread(target=send_pre_encoded_data_to_unreal, args=(encoded_facial_data, start_event, 60, socket_connection))
-
-    audio_thread.start()
-    data_thread.start()
-    
-    start_event.set()
+        generated_facial_data = apply_dominant_emotion(np.array(generated_facial_data, dtype=np.float32))
     
-    audio_thread.join()
-    data_thread.join()
-
-    with queue_lock:
-        stop_default_animation.clear()
-        default_animation_thread = Thread(target=default_animation_loop, args=(py_face,))
-        default_animation_thread.start()
-
-
-
-
-
+    # Borrow a temporary encoding instance for blending.
+    encoding_face = acquire_encoding_face()
+    try:
+        encoded_facial_data = pre_encode_facial_data(generated_facial_data, encoding_face)
+    finally:
+        release_encoding_face(encoding_face)
+
+    fut = enqueue_animation(play_audio_from_path, audio_path, encoded_facial_data, socket_connection)
+    fut.result()
@@ -4,9 +4,9 @@
 
 
 import time
-from threading import Thread, Lock
+from threading import Lock
 
-from livelink.animations.default_animation import default_animation_loop, stop_default_animation
+from livelink.animations.default_animation import pause_default_animation, resume_default_animation
 from livelink.send_to_unreal import pre_encode_facial_data_blend_in, pre_encode_facial_data_blend_out, pre_encode_facial_data
 from utils.generated_runners import play_audio_and_animation_openai_realtime
 
@@ -15,13 +15,11 @@ queue_lock = Lock()
 
 def check_and_restart_default_animation(accumulated_audio, encoded_facial_data, audio_face_queue, py_face):
     """
-    Restarts default animation if no data is available.
+    Resumes default animation if no data is available.
     """
     with queue_lock:
         if not accumulated_audio and not encoded_facial_data and audio_face_queue.empty():
-            stop_default_animation.clear()
-            new_default_thread = Thread(target=default_animation_loop, args=(py_face,))
-            new_default_thread.start()
+            resume_default_animation()
 
 def playback_loop(stop_worker, start_event, accumulated_audio, encoded_facial_data, audio_face_queue, py_face, socket_connection, default_animation_thread, log_queue):
     """
@@ -38,9 +36,7 @@ def playback_loop(stop_worker, start_event, accumulated_audio, encoded_facial_da
             accumulated_audio.clear()
             encoded_facial_data.clear()
 
-        stop_default_animation.set()
-        if default_animation_thread and default_animation_thread.is_alive():
-            default_animation_thread.join()
+        pause_default_animation()
 
         playback_start_time = time.time()
 
@@ -0,0 +1,68 @@
+# This software is licensed under a **dual-license model**
+# For individuals and businesses earning **under $1M per year**, this software is licensed under the **MIT License**
+# Businesses or organizations with **annual revenue of $1,000,000 or more** must obtain permission to use this software commercially.
+
+# runtime_singleton.py
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from socket import socket
+from threading import Thread, Lock
+from typing import Optional
+
+from livelink.connect.livelink_init import create_socket_connection, initialize_py_face
+from livelink.connect.pylivelinkface import PyLiveLinkFace
+from livelink.animations.default_animation import default_animation_loop, shutdown_default_animation
+from utils.generated_runners import preload_encoding_faces, start_animation_worker, stop_animation_worker
+
+
+@dataclass
+class Runtime:
+    """The LiveLink face, socket and default animation shared by every API in the process."""
+    py_face: PyLiveLinkFace
+    socket_connection: socket
+    default_animation_thread: Thread
+    # Single worker: saved animations are loaded, played and cleaned up one at a time
+    animation_executor: ThreadPoolExecutor
+
+
+_runtime: Optional[Runtime] = None
+_runtime_shut_down = False
+_runtime_lock = Lock()
+
+
+def get_runtime() -> Runtime:
+    """Return the process-wide Runtime, creating it on first use. Raises RuntimeError after shutdown_runtime()."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime_shut_down:
+            raise RuntimeError("The LiveLink runtime has been shut down")
+        if _runtime is None:
+            py_face = initialize_py_face()
+            socket_connection = create_socket_connection()
+            default_animation_thread = Thread(target=default_animation_loop, args=(py_face,))
+            default_animation_thread.start()
+            start_animation_worker()
+            preload_encoding_faces()
+            _runtime = Runtime(
+                py_face=py_face,
+                socket_connection=socket_connection,
+                default_animation_thread=default_animation_thread,
+                animation_executor=ThreadPoolExecutor(max_workers=1, thread_name_prefix="anim"),
+            )
+        return _runtime
+
+
+def shutdown_runtime() -> None:
+    """Stop the Runtime's workers and close its socket. Safe to call more than once."""
+    global _runtime, _runtime_shut_down
+    with _runtime_lock:
+        _runtime_shut_down = True
+        runtime, _runtime = _runtime, None
+    if runtime is None:
+        return
+    runtime.animation_executor.shutdown(wait=True)
+    stop_animation_worker()
+    shutdown_default_animation()
+    runtime.default_animation_thread.join()
+    runtime.socket_connection.close()
@@ -13,7 +13,7 @@ warnings.filterwarnings(
 from threading import Thread
 
 from livelink.connect.livelink_init import create_socket_connection, initialize_py_face
-from livelink.animations.default_animation import default_animation_loop, stop_default_animation
+from livelink.animations.default_animation import default_animation_loop, shutdown_default_animation
 from utils.audio_face_workers import process_wav_file
 from utils.files.file_utils import  initialize_directories, ensure_wav_input_folder_exists, list_wav_files
 
@@ -65,7 +65,7 @@ if __name__ == "__main__":
 
     finally:
         # Stop the default animation when quitting
-        stop_default_animation.set()
+        shutdown_default_animation()
         if default_animation_thread:
             default_animation_thread.join()
         pygame.quit()
@@ -15,7 +15,7 @@ import keyboard
 import time      
 
 from livelink.connect.livelink_init import create_socket_connection, initialize_py_face
-from livelink.animations.default_animation import default_animation_loop, stop_default_animation
+from livelink.animations.default_animation import default_animation_loop, shutdown_default_animation
 from utils.tts.tts_bridge import tts_worker
 from utils.files.file_utils import initialize_directories
 from utils.llm.chat_utils import load_chat_history, save_chat_log
@@ -138,7 +138,7 @@ def main():
         audio_queue.join()
         audio_queue.put(None)
         audio_worker_thread.join()
-        stop_default_animation.set()
+        shutdown_default_animation()
         default_animation_thread.join()
         pygame.quit()
         socket_connection.close()